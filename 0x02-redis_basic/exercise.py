@@ -4,10 +4,251 @@ This module provides a Cache class that allows storing and
 retrieving data from Redis, tracking call counts and history.
 """
 
-import redis
-import uuid
-from typing import Union, Callable, Optional
+import asyncio
+import atexit
+import inspect
+import os
+import sys
+import threading
+import weakref
+from collections import Counter
 from functools import wraps
+from operator import methodcaller
+from typing import Callable, Iterable, List, Optional, Union
+
+import hiredis  # noqa: F401 - required so replies use the C parser
+import msgpack
+import redis
+import redis.asyncio
+
+try:
+    from redis._parsers import (  # redis-py >= 5
+        _AsyncHiredisParser as _AsyncParser,
+        _HiredisParser as _Parser,
+    )
+except ImportError:
+    from redis.asyncio.connection import HiredisParser as _AsyncParser
+    from redis.connection import HiredisParser as _Parser
+
+
+_REDIS_SOCKET = "/var/run/redis/redis.sock"
+
+
+def _make_pool(pool_class: type, parser_class: type, **overrides):
+    """
+    Build a connection pool shared by every cache in this process.
+
+    REDIS_URL is honoured when set (including unix:// socket URLs).
+    Otherwise a local server's Unix domain socket is preferred when it
+    exists, falling back to the default localhost TCP connection.
+    Replies are always decoded by the hiredis parser, and idle
+    connections are health-checked before reuse.
+
+    Every command on the pool is bound by a 5s socket_timeout, so a
+    reply slower than that raises redis.TimeoutError. Keyword
+    overrides replace any of the default connection options.
+    """
+    options = {
+        "max_connections": 32,
+        "parser_class": parser_class,
+        "socket_timeout": 5,
+        "health_check_interval": 30,
+    }
+    options.update(overrides)
+    url = os.environ.get("REDIS_URL")
+    if not url and os.path.exists(_REDIS_SOCKET):
+        url = f"unix://{_REDIS_SOCKET}"
+    if not url or not url.startswith("unix://"):
+        # redis-py already sets TCP_NODELAY on TCP sockets
+        options["socket_keepalive"] = True
+    if url:
+        return pool_class.from_url(url, **options)
+    return pool_class(**options)
+
+
+_POOL = _make_pool(redis.BlockingConnectionPool, _Parser)
+
+
+def _untimed_pool(pool):
+    """
+    Build a one-connection pool with pool's settings but no socket timeout.
+
+    Used for commands such as a blocking FLUSHDB that can legitimately
+    outlast the shared pools' 5s socket_timeout.
+    """
+    kwargs = dict(pool.connection_kwargs, socket_timeout=None)
+    # Newer redis-py binds this handler to the source pool; the new
+    # pool creates its own
+    kwargs.pop("maint_notifications_pool_handler", None)
+    return type(pool)(
+        connection_class=pool.connection_class, max_connections=1, **kwargs)
+
+
+# asyncio pools bind to the event loop that first uses them, so each
+# running loop gets its own client, created on first use.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _async_client() -> redis.asyncio.Redis:
+    """
+    Return the asyncio client for the running event loop.
+
+    Entries for loops that have since closed are dropped whenever a
+    new one is created, since each client keeps its loop alive. Their
+    connections cannot be disconnected once the loop is gone, so they
+    are only reclaimed by garbage collection; call AsyncCache.aclose()
+    (or use AsyncCache as an async context manager) before the loop
+    ends to close them cleanly.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        for stale in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[stale]
+        pool = _make_pool(redis.asyncio.BlockingConnectionPool, _AsyncParser)
+        client = redis.asyncio.Redis(connection_pool=pool)
+        _async_clients[loop] = client
+    return client
+
+
+def _pack(value) -> bytes:
+    """
+    Serialize a history entry with MessagePack.
+
+    Objects msgpack cannot encode natively are stored as their repr.
+    """
+    return msgpack.packb(value, use_bin_type=True, default=repr)
+
+
+_ENCODERS = {
+    bytes: bytes,
+    str: str.encode,
+    int: lambda value: b"%d" % value,
+    float: lambda value: repr(value).encode(),
+}
+
+
+def _encode(data):
+    """
+    Encode a value to the bytes Redis will store, skipping the
+    client's generic per-call type dispatch.
+
+    Only exact bytes, str, int and float take the fast path; anything
+    else (None, bool, ...) is returned unchanged so the client's own
+    encoder still validates it and raises DataError.
+    """
+    encoder = _ENCODERS.get(type(data))
+    if encoder is None:
+        return data
+    return encoder(data)
+
+
+_UTF8 = methodcaller('decode', 'utf-8')
+
+
+# Call histories are streams of {in, out} entries, trimmed to roughly
+# this many entries by XADD MAXLEN ~.
+_HISTORY_MAXLEN = 100_000
+
+# Cache.store's counter, history and value writes, run server-side
+# as one EVALSHA. KEYS: counter, history, value key.
+# ARGV: packed args, encoded value, packed output, history maxlen.
+_STORE_LUA = """
+redis.call('INCR', KEYS[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[4], '*',
+           'in', ARGV[1], 'out', ARGV[3])
+redis.call('SET', KEYS[3], ARGV[2])
+return KEYS[3]
+"""
+_STORE_SCRIPT = redis.Redis(connection_pool=_POOL).register_script(_STORE_LUA)
+_STORE_COUNTER = "Cache.store"
+_STORE_HISTORY = f"{_STORE_COUNTER}:history"
+
+_COUNTER_FLUSH_EVERY = 100
+_pending_calls = Counter()
+_pending_lock = threading.Lock()
+
+
+def _take_pending(key: str) -> int:
+    """
+    Record one call locally and return the batch to send, if any.
+
+    Returns the accumulated count once it reaches _COUNTER_FLUSH_EVERY
+    (resetting it), and 0 otherwise.
+    """
+    with _pending_lock:
+        _pending_calls[key] += 1
+        pending = _pending_calls[key]
+        if pending < _COUNTER_FLUSH_EVERY:
+            return 0
+        del _pending_calls[key]
+        return pending
+
+
+def _drain_pending() -> dict:
+    """
+    Take every locally accumulated call count, leaving none behind.
+    """
+    with _pending_lock:
+        pending = dict(_pending_calls)
+        _pending_calls.clear()
+    return pending
+
+
+def _restore_pending(pending: dict) -> None:
+    """
+    Put back counts whose flush failed so they are sent later.
+    """
+    with _pending_lock:
+        _pending_calls.update(pending)
+
+
+def _flush_counters(client: redis.Redis) -> None:
+    """
+    Send every locally accumulated call count with INCRBY.
+    """
+    pending = _drain_pending()
+    if not pending:
+        return
+    pipe = client.pipeline(transaction=False)
+    for key, count in pending.items():
+        pipe.incrby(key, count)
+    try:
+        pipe.execute()
+    except redis.RedisError:
+        _restore_pending(pending)
+        raise
+
+
+async def _async_flush_counters(client: redis.asyncio.Redis) -> None:
+    """
+    Coroutine counterpart of _flush_counters.
+    """
+    pending = _drain_pending()
+    if not pending:
+        return
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, count in pending.items():
+                pipe.incrby(key, count)
+            await pipe.execute()
+    except redis.RedisError:
+        _restore_pending(pending)
+        raise
+
+
+@atexit.register
+def _flush_counters_at_exit() -> None:
+    """
+    Flush pending call counts when the interpreter exits.
+
+    Counts from both Cache and AsyncCache methods are sent over the
+    synchronous pool, since no event loop is running at exit.
+    """
+    try:
+        _flush_counters(redis.Redis(connection_pool=_POOL))
+    except redis.RedisError:
+        pass
 
 
 def count_calls(method: Callable) -> Callable:
@@ -16,55 +257,165 @@ def count_calls(method: Callable) -> Callable:
 
     Stores the count in Redis under the method's qualified name.
     """
+    key = method.__qualname__
+
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        key = method.__qualname__
         self._redis.incr(key)
         return method(self, *args, **kwargs)
     return wrapper
 
 
+def _record(client, history_key: str, args: tuple, result) -> None:
+    """
+    Append one (input, output) pair to a method's history stream.
+    """
+    client.xadd(
+        history_key,
+        {"in": _pack(args), "out": _pack(result)},
+        maxlen=_HISTORY_MAXLEN,
+        approximate=True,
+    )
+
+
 def call_history(method: Callable) -> Callable:
     """
     Decorator that stores the history of inputs and outputs for a method.
 
-    Inputs are stored in <method_name>:inputs and outputs in <method_name>:outputs.
+    Each call appends one entry to the <method_name>:history stream.
+    A call that raises is still recorded, with the exception's repr
+    as its output, before the exception propagates.
     """
+    history_key = f"{method.__qualname__}:history"
+
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        input_key = f"{method.__qualname__}:inputs"
-        output_key = f"{method.__qualname__}:outputs"
-
-        # Store input arguments as string
-        self._redis.rpush(input_key, str(args))
-
         # Execute original method
-        result = method(self, *args, **kwargs)
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception as exc:
+            _record(self._redis, history_key, args, repr(exc))
+            raise
 
-        # Store output
-        self._redis.rpush(output_key, str(result))
+        # Store inputs and output together
+        _record(self._redis, history_key, args, result)
 
         return result
     return wrapper
 
 
+def _hide_client(method: Callable, wrapper: Callable) -> Callable:
+    """
+    Give wrapper method's signature minus the injected pipeline argument.
+
+    wraps() points inspect at the original method through __wrapped__,
+    which would otherwise advertise the client parameter to callers.
+    """
+    signature = inspect.signature(method)
+    params = list(signature.parameters.values())
+    del params[1]
+    wrapper.__signature__ = signature.replace(parameters=params)
+    return wrapper
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorator that counts calls and records inputs/outputs in one round-trip.
+
+    The history XADD and any commands the method itself queues are
+    sent through a single pipeline. The wrapped method receives that
+    pipeline as its first argument after self and must only queue
+    commands on it, returning a value that is known client-side.
+
+    Calls are counted in-process and added to the Redis counter with
+    INCRBY every _COUNTER_FLUSH_EVERY calls, riding on that pipeline;
+    use Cache.flush_counters() to publish the remainder.
+    """
+    key = method.__qualname__
+    history_key = f"{key}:history"
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        pipe = self._redis.pipeline(transaction=False)
+        pending = _take_pending(key)
+        if pending:
+            pipe.incrby(key, pending)
+
+        # The method queues its own writes on the same pipeline
+        result = method(self, pipe, *args, **kwargs)
+
+        _record(pipe, history_key, args, result)
+        pipe.execute()
+        return result
+    return _hide_client(method, wrapper)
+
+
+def async_instrumented(method: Callable) -> Callable:
+    """
+    Coroutine counterpart of instrumented for AsyncCache methods.
+
+    The wrapped method is a plain function that queues its commands
+    on the pipeline it is given; the wrapper awaits the single execute().
+    Call counts are batched the same way; use AsyncCache.flush_counters()
+    to publish the remainder.
+    """
+    key = method.__qualname__
+    history_key = f"{key}:history"
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pending = _take_pending(key)
+            if pending:
+                pipe.incrby(key, pending)
+
+            # The method queues its own writes on the same pipeline
+            result = method(self, pipe, *args, **kwargs)
+
+            _record(pipe, history_key, args, result)
+            await pipe.execute()
+        return result
+    return _hide_client(method, wrapper)
+
+
 class Cache:
     """
     Cache class that interfaces with a Redis data store.
     """
 
-    def __init__(self):
+    def __init__(self, *, flush: bool = False, flush_async: bool = True):
         """
-        Initialize the Cache instance and flush the Redis database.
+        Initialize the Cache instance on the shared connection pool.
+
+        Args:
+            flush: If True, flush the Redis database first.
+            flush_async: Use FLUSHDB ASYNC so Redis frees the keys in
+                the background instead of blocking construction. A
+                blocking flush is sent on a one-off connection without
+                the shared pool's socket timeout, since it can run long.
         """
-        self._redis = redis.Redis()
-        self._redis.flushdb()
+        self._redis = redis.Redis(connection_pool=_POOL)
+        if flush and flush_async:
+            self._redis.flushdb(asynchronous=True)
+        elif flush:
+            pool = _untimed_pool(self._redis.connection_pool)
+            try:
+                redis.Redis(connection_pool=pool).flushdb()
+            finally:
+                pool.disconnect()
+
+    def flush_counters(self) -> None:
+        """
+        Publish call counts that instrumented methods are still holding locally.
+        """
+        _flush_counters(self._redis)
 
-    @call_history
-    @count_calls
     def store(self, data: Union[str, bytes, int, float]) -> str:
         """
-        Store the given data in Redis using a random UUID key.
+        Store the given data in Redis under a random 128-bit hex key.
+
+        The call count, history and SET are applied atomically by a Lua
+        script in a single EVALSHA round-trip.
 
         Args:
             data: The data to store. Can be str, bytes, int, or float.
@@ -72,14 +423,74 @@ class Cache:
         Returns:
             The key under which the data is stored, as a string.
         """
-        key = str(uuid.uuid4())
-        self._redis.set(key, data)
+        key = os.urandom(16).hex()
+        _STORE_SCRIPT(
+            keys=[_STORE_COUNTER, _STORE_HISTORY, key],
+            args=[_pack((data,)), _encode(data), _pack(key), _HISTORY_MAXLEN],
+            client=self._redis,
+        )
         return key
 
+    @instrumented
+    def store_int(self, client, n: int) -> str:
+        """
+        Store an integer under a random key, skipping value encoding.
+
+        The value is formatted with b"%d" and queued as a raw SET on
+        the pipeline supplied by instrumented, which counts the call and
+        records it in the Cache.store_int history in the same round-trip.
+
+        Args:
+            client: Pipeline to queue the SET on (supplied by the decorator).
+            n: The integer to store.
+
+        Returns:
+            The key under which the integer is stored, as a string.
+
+        Raises:
+            TypeError: If n is not exactly an int (bools and floats
+                included), since b"%d" would silently coerce it.
+        """
+        if type(n) is not int:
+            raise TypeError(f"store_int expects an int, got {type(n).__name__}")
+        key = os.urandom(16).hex()
+        client.execute_command('SET', key, b"%d" % n)
+        return key
+
+    def store_many(self, items: Iterable[Union[str, bytes, int, float]]) -> List[str]:
+        """
+        Store several values in one round-trip.
+
+        Values are written with a single MSET and recorded in store's
+        counter and history as if store had been called for each one;
+        the history entries are pipelined XADDs.
+
+        Args:
+            items: The values to store. Each can be str, bytes, int, or float.
+
+        Returns:
+            The keys under which the values are stored, in order.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        keys = [os.urandom(16).hex() for _ in items]
+
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.mset({key: _encode(item) for key, item in zip(keys, items)})
+        for key, item in zip(keys, items):
+            _record(pipe, _STORE_HISTORY, (item,), key)
+        pipe.incrby(_STORE_COUNTER, len(items))
+        pipe.execute()
+        return keys
+
     def get(self, key: str, fn: Optional[Callable] = None) -> Union[str, bytes, int, float, None]:
         """
         Retrieve data from Redis and optionally convert it using a callable.
 
+        Kept for compatibility; get_raw and get_with avoid the fn check.
+
         Args:
             key: The key to retrieve from Redis.
             fn: Optional function to convert the result to the desired format.
@@ -87,10 +498,35 @@ class Cache:
         Returns:
             The retrieved data, possibly transformed by fn, or None.
         """
+        if fn is None:
+            return self.get_raw(key)
+        return self.get_with(key, fn)
+
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve the raw bytes stored under key.
+
+        Args:
+            key: The key to retrieve from Redis.
+
+        Returns:
+            The stored bytes, or None if key doesn't exist.
+        """
+        return self._redis.get(key)
+
+    def get_with(self, key: str, fn: Callable) -> Union[str, bytes, int, float, None]:
+        """
+        Retrieve data from Redis and convert it with fn.
+
+        Args:
+            key: The key to retrieve from Redis.
+            fn: Function to convert the stored bytes.
+
+        Returns:
+            The converted data, or None if key doesn't exist.
+        """
         data = self._redis.get(key)
-        if data is None:
-            return None
-        return fn(data) if fn else data
+        return None if data is None else fn(data)
 
     def get_str(self, key: str) -> Optional[str]:
         """
@@ -102,7 +538,7 @@ class Cache:
         Returns:
             The decoded string or None if key doesn't exist.
         """
-        return self.get(key, fn=lambda d: d.decode('utf-8'))
+        return self.get_with(key, _UTF8)
 
     def get_int(self, key: str) -> Optional[int]:
         """
@@ -114,9 +550,202 @@ class Cache:
         Returns:
             The integer value or None if key doesn't exist.
         """
-        return self.get(key, fn=int)
+        return self.get_with(key, int)
+
+
+class AsyncCache:
+    """
+    Asyncio variant of Cache for callers running many coroutines.
+
+    Concurrent calls on the same event loop share that loop's
+    connection pool, so they overlap instead of blocking the loop.
+    Await aclose(), or use ``async with AsyncCache() as cache:``,
+    before the loop ends; pooled sockets are not closed otherwise.
+    """
+
+    @property
+    def _redis(self) -> redis.asyncio.Redis:
+        """
+        The asyncio client bound to the running event loop.
+        """
+        return _async_client()
+
+    async def aclose(self) -> None:
+        """
+        Close the running loop's pooled connections.
+
+        The pool is shared by every AsyncCache on this loop; later calls
+        on any of them open a fresh one.
+        """
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.connection_pool.disconnect()
+
+    async def __aenter__(self) -> "AsyncCache":
+        """
+        Enter an ``async with`` block that closes the pool on exit.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """
+        Close the running loop's pooled connections.
+        """
+        await self.aclose()
+
+    async def flush_counters(self) -> None:
+        """
+        Publish call counts that instrumented methods are still holding locally.
+        """
+        await _async_flush_counters(self._redis)
+
+    async def flush(self, asynchronous: bool = True) -> None:
+        """
+        Flush the Redis database.
+
+        Constructors cannot await, so this replaces Cache's flush=True.
+
+        Args:
+            asynchronous: Use FLUSHDB ASYNC so Redis frees the keys in
+                the background. A blocking flush is sent on a one-off
+                connection without the pool's socket timeout, since it
+                can run long.
+        """
+        if asynchronous:
+            await self._redis.flushdb(asynchronous=True)
+            return
+        pool = _untimed_pool(self._redis.connection_pool)
+        try:
+            await redis.asyncio.Redis(connection_pool=pool).flushdb()
+        finally:
+            await pool.disconnect()
+
+    @async_instrumented
+    def store(self, client, data: Union[str, bytes, int, float]) -> str:
+        """
+        Store the given data in Redis under a random 128-bit hex key.
+
+        Callers pass only data; async_instrumented supplies the pipeline
+        the SET is queued on.
+
+        Args:
+            data: The data to store. Can be str, bytes, int, or float.
+
+        Returns:
+            The key under which the data is stored, as a string.
+        """
+        key = os.urandom(16).hex()
+        client.set(key, _encode(data))
+        return key
+
+    async def store_many(self, items: Iterable[Union[str, bytes, int, float]]) -> List[str]:
+        """
+        Store several values in one round-trip.
+
+        Values are written with a single MSET and recorded in store's
+        counter and history as if store had been called for each one;
+        the history entries are pipelined XADDs.
+
+        Args:
+            items: The values to store. Each can be str, bytes, int, or float.
+
+        Returns:
+            The keys under which the values are stored, in order.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        name = self.store.__qualname__
+        history_key = f"{name}:history"
+        keys = [os.urandom(16).hex() for _ in items]
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.mset({key: _encode(item) for key, item in zip(keys, items)})
+            for key, item in zip(keys, items):
+                _record(pipe, history_key, (item,), key)
+            pipe.incrby(name, len(items))
+            await pipe.execute()
+        return keys
+
+    async def get(self, key: str, fn: Optional[Callable] = None) -> Union[str, bytes, int, float, None]:
+        """
+        Retrieve data from Redis and optionally convert it using a callable.
+
+        Kept for compatibility; get_raw and get_with avoid the fn check.
+
+        Args:
+            key: The key to retrieve from Redis.
+            fn: Optional function to convert the result to the desired format.
+
+        Returns:
+            The retrieved data, possibly transformed by fn, or None.
+        """
+        if fn is None:
+            return await self.get_raw(key)
+        return await self.get_with(key, fn)
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve the raw bytes stored under key.
+
+        Args:
+            key: The key to retrieve from Redis.
+
+        Returns:
+            The stored bytes, or None if key doesn't exist.
+        """
+        return await self._redis.get(key)
+
+    async def get_with(self, key: str, fn: Callable) -> Union[str, bytes, int, float, None]:
+        """
+        Retrieve data from Redis and convert it with fn.
+
+        Args:
+            key: The key to retrieve from Redis.
+            fn: Function to convert the stored bytes.
+
+        Returns:
+            The converted data, or None if key doesn't exist.
+        """
+        data = await self._redis.get(key)
+        return None if data is None else fn(data)
+
+    async def get_str(self, key: str) -> Optional[str]:
+        """
+        Retrieve a UTF-8 string from Redis using the provided key.
+
+        Args:
+            key: The key to retrieve from Redis.
+
+        Returns:
+            The decoded string or None if key doesn't exist.
+        """
+        return await self.get_with(key, _UTF8)
+
+    async def get_int(self, key: str) -> Optional[int]:
+        """
+        Retrieve an integer from Redis using the provided key.
+
+        Args:
+            key: The key to retrieve from Redis.
+
+        Returns:
+            The integer value or None if key doesn't exist.
+        """
+        return await self.get_with(key, int)
+
 
-from typing import Callable
+_REPLAY_CHUNK = 10000
+
+
+def _format_entry(method_name: str, fields: dict) -> str:
+    """
+    Format one history stream entry as a replay output line.
+    """
+    decoded_input = tuple(msgpack.unpackb(fields[b"in"], raw=False))
+    decoded_output = msgpack.unpackb(fields[b"out"], raw=False)
+    return f"{method_name}(*{decoded_input}) -> {decoded_output}\n"
 
 
 def replay(method: Callable) -> None:
@@ -124,14 +753,24 @@ def replay(method: Callable) -> None:
     Display the history of calls of a particular function.
 
     It prints how many times the function was called,
-    then lists all inputs and outputs from Redis.
+    then lists all inputs and outputs from Redis, reading the
+    history stream in pages of _REPLAY_CHUNK entries.
     """
     redis_client = method.__self__._redis
     # Access Redis client from bound method
 
     method_name = method.__qualname__  # e.g., "Cache.store"
+    history_key = f"{method_name}:history"
+
+    # Publish locally batched call counts so the total is exact
+    _flush_counters(redis_client)
+
+    # Fetch the counter and the first page of history in one round-trip
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.get(method_name)
+    pipe.xrange(history_key, "-", "+", count=_REPLAY_CHUNK)
+    calls, entries = pipe.execute()
 
-    calls = redis_client.get(method_name)
     try:
         calls_int = int(calls) if calls else 0
     except Exception:
@@ -139,10 +778,12 @@ def replay(method: Callable) -> None:
 
     print(f"{method_name} was called {calls_int} times:")
 
-    inputs = redis_client.lrange(f"{method_name}:inputs", 0, -1)
-    outputs = redis_client.lrange(f"{method_name}:outputs", 0, -1)
-
-    for inp, out in zip(inputs, outputs):
-        decoded_input = inp.decode()
-        decoded_output = out.decode()
-        print(f"{method_name}(*{decoded_input}) -> {decoded_output}")
+    while entries:
+        sys.stdout.writelines(
+            [_format_entry(method_name, fields) for _, fields in entries])
+        if len(entries) < _REPLAY_CHUNK:
+            break
+        # Resume just after the last entry read
+        last_id = entries[-1][0].decode()
+        entries = redis_client.xrange(
+            history_key, f"({last_id}", "+", count=_REPLAY_CHUNK)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+""" Main file """
+
+Cache = __import__('exercise').Cache
+replay = __import__('exercise').replay
+
+cache = Cache(flush=True)
+
+for value in (b"first", "second", 3, 4.5):
+    key = cache.store(value)
+    print(key, cache.get(key))
+
+for n in (1, 2, 3):
+    key = cache.store_int(n)
+    print(key, cache.get_int(key))
+
+replay(cache.store)
+replay(cache.store_int)